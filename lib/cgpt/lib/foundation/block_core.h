@@ -139,7 +139,6 @@ inline void vectorBlockOrthonormalize(Lattice<CComplex> &ip,VLattice &Basis, siz
       sip += ip;
     }
     sip = pow(sip,-0.5);
-    ip = Zero();
     for (size_t j=0;j<n_virtual;j++)
       blockZAXPY(Basis[j + v*n_virtual],sip,Basis[j + v*n_virtual],zz);
   }
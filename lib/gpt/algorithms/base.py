@@ -87,7 +87,7 @@ class base_iterative(base):
 
     def log_convergence(self, iteration, value, target=None):
         if (isinstance(iteration, int) and iteration == 0) or (
-            isinstance(iteration, tuple) and all([x == 0 for x in iteration])
+            isinstance(iteration, tuple) and all(x == 0 for x in iteration)
         ):
             self.history = []
             self.log_file = self.get_log_file()
@@ -64,14 +64,15 @@ class cagcr(base_iterative):
             alpha = np.empty((rlen), g.double.complex_dtype)
 
             # fields
-            r, mmpsi = g.copy(src), g.copy(src)
+            r, mmpsi = g.lattice(src), g.lattice(src)
             p = [g.lattice(src) for i in range(rlen + 1)]
             # in QUDA, q is just an "alias" to p with q[k] = p[k+1]
             # don't alias here, but just use slicing
 
-            # initial residual
-            r2 = self.calc_res(mat, psi, mmpsi, src, r)
-            p[0] @= r
+            # initial residual, r only needs to be kept separately if it is updated below
+            r2 = self.calc_res(mat, psi, mmpsi, src, p[0])
+            if self.maxiter != rlen:
+                r @= p[0]
 
             # source
             ssq = g.norm2(src)
@@ -17,17 +17,32 @@
 #    51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 #
 import gpt as g
+from gpt.algorithms import base
 
 
-class calculate_residual:
+class calculate_residual(base):
     def __init__(self, tag=None):
+        super().__init__()
         self.tag = "" if tag is None else f"{tag}: "
 
     def __call__(self, mat):
         def inv(dst, src):
+            # residuals are only needed for the output, skip the global reductions otherwise
+            if not self.verbose:
+                return
+
+            # residuals mat * dst - src are computed in place of mat * dst
+            res = [g.lattice(x) for x in src]
+            mat(res, dst)
+            for i in range(len(dst)):
+                g.axpy(res[i], -1.0, src[i], res[i])
+
+            # one global reduction for all residuals and one for all sources
+            eps2 = g.norm2(res)
+            nrm2 = g.norm2(src)
             for i in range(len(dst)):
-                eps = g.norm2(mat * dst[i] - src[i]) ** 0.5
-                nrm = g.norm2(src[i]) ** 0.5
+                eps = eps2[i] ** 0.5
+                nrm = nrm2[i] ** 0.5
                 if nrm != 0.0:
                     g.message(
                         f"{self.tag}| mat * dst[{i}] - src[{i}] | / | src | = {eps/nrm}, | src[{i}] | = {nrm}"
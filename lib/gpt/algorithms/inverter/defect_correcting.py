@@ -100,8 +100,9 @@ class defect_correcting(base_iterative):
 
             for i in range(self.maxiter):
                 t("outer matrix")
+                outer_mat(_s, psi)
                 for j in range(n):
-                    _s[j] @= src[j] - outer_mat * psi[j]  # remaining src
+                    g.axpy(_s[j], -1.0, _s[j], src[j])  # remaining src
 
                 t("norm2")
                 norm2_of_defect = g.norm2(_s)
@@ -45,7 +45,7 @@ class fgcr(base_iterative):
             psi += chi[j] * p[j]
 
     def restart(self, mat, psi, mmpsi, src, r, p):
-        if self.prec is not None:
+        if p is not None:
             for v in p:
                 v[:] = 0
         return self.calc_res(mat, psi, mmpsi, src, r)
@@ -63,6 +63,11 @@ class fgcr(base_iterative):
 
         prec = self.prec(mat) if self.prec is not None else None
 
+        # only zero the preconditioner's lhs if it is used as a guess
+        prec_accept_guess = prec is not None
+        if isinstance(prec, g.matrix_operator):
+            prec_accept_guess = prec.accept_guess[0]
+
         @self.timed_function
         def inv(psi, src, t):
             t("setup")
@@ -78,12 +83,13 @@ class fgcr(base_iterative):
             chi = np.empty((rlen), dtype_c)
 
             # fields
-            r, mmpsi = g.copy(src), g.copy(src)
+            r, mmpsi = g.lattice(src), g.lattice(src)
             p = [g.lattice(src) for i in range(rlen)]
             z = [g.lattice(src) for i in range(rlen)]
+            p_guess = p if prec_accept_guess else None
 
             # initial residual
-            r2 = self.restart(mat, psi, mmpsi, src, r, p)
+            r2 = self.restart(mat, psi, mmpsi, src, r, p_guess)
 
             # source
             ssq = g.norm2(src)
@@ -103,7 +109,6 @@ class fgcr(base_iterative):
 
                 t("prec")
                 if prec is not None:
-                    p[i][:] = 0
                     prec(p[i], r)
                 else:
                     p[i] @= r
@@ -141,7 +146,7 @@ class fgcr(base_iterative):
 
                 if need_restart:
                     t("restart")
-                    r2 = self.restart(mat, psi, mmpsi, src, r, p)
+                    r2 = self.restart(mat, psi, mmpsi, src, r, p_guess)
                     self.debug("performed restart")
 
             msg = f"NOT converged in {k+1} iterations;  computed squared residual {r2:e} / {rsq:e}"
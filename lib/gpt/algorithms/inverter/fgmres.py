@@ -90,7 +90,10 @@ class fgmres(base_iterative):
             vector_space = mat.vector_space
             mat = mat.specialized_singlet_callable()
 
+        # only zero the preconditioner's lhs if it is used as a guess
+        prec_accept_guess = True
         if isinstance(prec, g.matrix_operator):
+            prec_accept_guess = prec.accept_guess[0]
             prec = prec.specialized_singlet_callable()
 
         @self.timed_function
@@ -110,19 +113,17 @@ class fgmres(base_iterative):
             gamma = np.zeros((rlen + 1), dtype)
 
             # fields
-            mmpsi, r = (
-                g.copy(src),
-                g.copy(src),
-            )
+            mmpsi, r = g.lattice(src), g.lattice(src)
             V = [g.lattice(src) for i in range(rlen + 1)]
             Z = (
                 [g.lattice(src) for i in range(rlen + 1)] if prec is not None else None
             )  # save vectors if unpreconditioned
             ZV = Z if prec is not None else V
+            Z_guess = Z if prec_accept_guess else None
 
             # initial residual
             t("restart")
-            r2 = self.restart(mat, psi, mmpsi, src, r, V, Z, gamma, t)
+            r2 = self.restart(mat, psi, mmpsi, src, r, V, Z_guess, gamma, t)
             t("setup")
 
             # source
@@ -143,7 +144,6 @@ class fgmres(base_iterative):
 
                 t("prec")
                 if prec is not None:
-                    ZV[i][:] = 0
                     prec(ZV[i], V[i])
 
                 t("mat")
@@ -181,7 +181,7 @@ class fgmres(base_iterative):
 
                 if need_restart:
                     t("restart")
-                    r2 = self.restart(mat, psi, mmpsi, src, r, V, Z, gamma, t)
+                    r2 = self.restart(mat, psi, mmpsi, src, r, V, Z_guess, gamma, t)
                     self.debug("performed restart")
 
             msg = f"NOT converged in {k+1} iterations;  computed squared residual {r2:e} / {rsq:e}"
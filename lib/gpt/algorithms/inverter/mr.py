@@ -45,12 +45,11 @@ class mr(base_iterative):
         def inv(psi, src, t):
             t("setup")
 
-            r, mmr = g.copy(src), g.copy(src)
+            r, mmr = g.lattice(src), g.lattice(src)
 
             mat(mmr, psi)
-            r @= src - mmr
+            r2 = g.axpy_norm2(r, -1.0, mmr, src)
 
-            r2 = g.norm2(r)
             ssq = g.norm2(src)
             # if ssq == 0.0:
             # assert r2 != 0.0  # need either source or psi to not be zero
@@ -22,18 +22,32 @@ from gpt.algorithms import base
 
 
 class multi_grid_setup:
-    @g.params_convention(block_size=None, projector=None)
+    @g.params_convention(block_size=None, projector=None, setup_precision=None)
     def __init__(self, params):
         self.block_size = params["block_size"]
+        self.setup_precision = params["setup_precision"]
         self.n = len(self.block_size)
-        self.projector = g.util.to_list(params["projector"]) * self.n
+        self.projector = g.util.to_list(params["projector"])
+        if len(self.projector) == 1:
+            self.projector = self.projector * self.n
+        assert len(self.projector) == self.n
 
     def __call__(self, matrix):
         levels = []
         grid = matrix.vector_space[0].grid
+        precision = grid.precision
         for i in range(self.n):
             grid = g.block.grid(grid, self.block_size[i])
-            basis = self.projector[i](matrix, grid)
+            if self.setup_precision is None:
+                basis = self.projector[i](matrix, grid)
+            else:
+                # near-null vectors only need to approximate the low modes, so they
+                # can be found at lower precision and re-orthonormalized afterwards
+                basis = self.projector[i](
+                    matrix.converted(self.setup_precision), grid.converted(self.setup_precision)
+                )
+                basis = g.convert(basis, precision)
+                g.block.map(grid, basis).orthonormalize()
             levels.append((grid, basis))
             if i != self.n - 1:
                 matrix = matrix.coarsened(*levels[-1])
@@ -41,7 +55,7 @@ class multi_grid_setup:
 
 
 class coarse_grid(base):
-    @g.params_convention(make_hermitian=False, save_links=True)
+    @g.params_convention(make_hermitian=False, save_links=True, rhs_n_block=4, basis_n_block=8)
     def __init__(self, coarse_inverter, coarse_grid, basis, params):
         super().__init__()
         self.params = params
@@ -53,24 +67,49 @@ class coarse_grid(base):
         assert isinstance(mat, g.matrix_operator)
         vector_space = mat.vector_space
 
-        bm = g.block.map(self.coarse_grid, self.basis)
+        # block sizes of the basis and right-hand sides processed together in the kernels
+        rhs_n_block = self.params["rhs_n_block"]
+        basis_n_block = self.params["basis_n_block"]
 
-        cmat = mat.coarsened(self.coarse_grid, self.basis)
+        bm = g.block.map(self.coarse_grid, self.basis, basis_n_block=basis_n_block)
+
+        cmat = mat.coarsened(
+            self.coarse_grid, self.basis, rhs_n_block=rhs_n_block, basis_n_block=basis_n_block
+        )
 
         cinv = self.coarse_inverter(cmat)
 
+        project = bm.project.specialized_list_callable()
+        promote = bm.promote.specialized_list_callable()
+
+        coarse_vector_space = bm.project.vector_space[0]
+        src_c = []
+        dst_c = []
+
+        # quantities that do not change between calls
+        cinv_accept_guess = cinv.accept_guess[0]
+        log_begin = f"{self.coarse_grid.fdimensions}" + " {"
+
         @self.timed_function
         def inv(dst, src, t):
             assert dst != src
-            self.log(f"{self.coarse_grid.fdimensions}" + " {")
+            self.log(log_begin)
+
+            t("setup")
+            n = len(src)
+            while len(src_c) < n:
+                src_c.append(coarse_vector_space.lattice())
+                dst_c.append(coarse_vector_space.lattice())
 
             t("project")
-            src_c = bm.project(src)
+            project(src_c[0:n], src)
             t("coarse inverter")
-            dst_c = cinv(src_c)
-            del src_c
+            if cinv_accept_guess:
+                for x in dst_c[0:n]:
+                    x[:] = 0
+            cinv(dst_c[0:n], src_c[0:n])
             t("promote")
-            bm.promote(dst, dst_c)
+            promote(dst, dst_c[0:n])
             t()
 
             self.log("}")
@@ -81,6 +120,6 @@ class coarse_grid(base):
             adj_mat=None,
             adj_inv_mat=None,
             vector_space=vector_space,
-            accept_guess=(True, False),
+            accept_guess=(False, False),
             accept_list=True,
         )
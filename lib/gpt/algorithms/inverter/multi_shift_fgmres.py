@@ -279,7 +279,7 @@ class multi_shift_fgmres(base_iterative):
                             msg += f";  true squared residual {res:e} / {rsq:e}"
                         self.log(msg)
 
-                if all([fgmres.converged for fgmres in sfgmres]):
+                if all(fgmres.converged for fgmres in sfgmres):
                     self.log(f"converged in {k+rlen} iterations")
                     return [fgmres.rho for fgmres in sfgmres] if rr else None
 
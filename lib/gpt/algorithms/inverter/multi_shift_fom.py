@@ -185,7 +185,7 @@ class multi_shift_fom(base_iterative):
                             msg += f";  true squared residual {res:e} / {rsq:e}"
                         self.log(msg)
 
-                if all([fom.converged for fom in sfoms]):
+                if all(fom.converged for fom in sfoms):
                     self.log(f"converged in {k+rlen} iterations")
                     return [fom.rho for fom in sfoms] if rr else None
 
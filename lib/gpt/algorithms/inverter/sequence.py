@@ -27,18 +27,36 @@ class sequence:
     def __call__(self, outer_mat):
         inverters_mat = [i(outer_mat) for i in self.inverters]
 
-        def inv(dst, src):
-            for i in inverters_mat:
-                i(dst, src)
-
         vector_space = None
         if isinstance(outer_mat, g.matrix_operator):
             vector_space = outer_mat.vector_space
 
+        # list operators can be called directly if they do not need to distribute
+        inverters_list_callable = []
+        for i in inverters_mat:
+            if isinstance(i, g.matrix_operator) and i.accept_list:
+                i_otype = i.vector_space[1].otype
+                if i_otype is None or (
+                    vector_space is not None
+                    and vector_space[1].otype is not None
+                    and vector_space[1].match_otype(i_otype)
+                ):
+                    i = i.specialized_list_callable()
+            inverters_list_callable.append(i)
+
+        def inv(dst, src):
+            for i in inverters_list_callable:
+                i(dst, src)
+
+        # the guess is only used if the first inverter uses it
+        accept_guess = True
+        if inverters_mat and isinstance(inverters_mat[0], g.matrix_operator):
+            accept_guess = inverters_mat[0].accept_guess[0]
+
         return g.matrix_operator(
             mat=inv,
             inv_mat=outer_mat,
             vector_space=vector_space,
-            accept_guess=(True, False),
+            accept_guess=(accept_guess, False),
             accept_list=True,
         )
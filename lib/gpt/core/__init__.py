@@ -28,7 +28,7 @@ from gpt.core.peekpoke import map_key
 from gpt.core.tensor import tensor
 from gpt.core.epsilon import epsilon, sign_of_permutation
 from gpt.core.gamma import gamma, gamma_base
-from gpt.core.time import time, timer
+from gpt.core.time import time, timer, disabled_timer
 from gpt.core.log import message
 from gpt.core.auto_tune import auto_tuned_class, auto_tuned_method
 from gpt.core.pin import pin
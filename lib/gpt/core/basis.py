@@ -29,7 +29,7 @@ verbose_performance = is_verbose("orthogonalize_performance")
 
 def orthogonalize(w, basis, ips=None, nblock=4):
     # verbosity
-    t = gpt.timer("orthogonalize", verbose_performance)
+    t = gpt.timer("orthogonalize") if verbose_performance else gpt.disabled_timer
     n = len(basis)
     if n == 0:
         return
@@ -24,6 +24,10 @@ import gpt, cgpt
 #                 A larger number is generally more performant, however, requires more available
 #                 cache/accelerator memory.
 #
+# coarse_operator/fine_operator:  The returned operators keep one pair of fine/coarse work
+#                 vectors per right-hand side of the largest call for their lifetime.
+#                 Callers that act on many vectors at once pay this memory permanently.
+#
 class map:
     def __init__(self, coarse_grid, basis, mask=None, basis_n_block=8):
         assert isinstance(coarse_grid, gpt.grid)
@@ -101,16 +105,21 @@ class map:
     def coarse_operator(self, fine_operator):
         verbose = gpt.default.is_verbose("block_operator")
 
+        src_fine = []
+        dst_fine = []
+
         def mat(dst_coarse, src_coarse):
-            src_fine = [gpt.lattice(self.basis[0]) for x in src_coarse]
-            dst_fine = [gpt.lattice(self.basis[0]) for x in src_coarse]
+            n = len(src_coarse)
+            while len(src_fine) < n:
+                src_fine.append(gpt.lattice(self.basis[0]))
+                dst_fine.append(gpt.lattice(self.basis[0]))
 
             t0 = gpt.time()
-            self.promote(src_fine, src_coarse)
+            self.promote(src_fine[0:n], src_coarse)
             t1 = gpt.time()
-            fine_operator(dst_fine, src_fine)
+            fine_operator(dst_fine[0:n], src_fine[0:n])
             t2 = gpt.time()
-            self.project(dst_coarse, dst_fine)
+            self.project(dst_coarse, dst_fine[0:n])
             t3 = gpt.time()
             if verbose:
                 gpt.message(
@@ -129,16 +138,21 @@ class map:
         verbose = gpt.default.is_verbose("block_operator")
         coarse_otype = gpt.ot_vector_complex_additive_group(len(self.basis))
 
+        csrc = []
+        cdst = []
+
         def mat(dst, src):
-            csrc = [gpt.lattice(self.coarse_grid, coarse_otype) for x in src]
-            cdst = [gpt.lattice(self.coarse_grid, coarse_otype) for x in src]
+            n = len(src)
+            while len(csrc) < n:
+                csrc.append(gpt.lattice(self.coarse_grid, coarse_otype))
+                cdst.append(gpt.lattice(self.coarse_grid, coarse_otype))
 
             t0 = gpt.time()
-            self.project(csrc, src)
+            self.project(csrc[0:n], src)
             t1 = gpt.time()
-            coarse_operator(cdst, csrc)
+            coarse_operator(cdst[0:n], csrc[0:n])
             t2 = gpt.time()
-            self.promote(dst, cdst)
+            self.promote(dst, cdst[0:n])
             t3 = gpt.time()
             if verbose:
                 gpt.message(
@@ -315,7 +315,7 @@ def apply_type_right_to_left(e, t):
 
 
 def expr_eval(first, second=None, ac=False):
-    t = gpt.timer("eval", verbose_performance)
+    t = gpt.timer("eval") if verbose_performance else gpt.disabled_timer
 
     # this will always evaluate to a (list of) lattice object(s)
     # or remain an expression if it cannot do so
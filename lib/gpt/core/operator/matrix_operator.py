@@ -220,6 +220,12 @@ class matrix_operator(factor):
 
         return self
 
+    def _mat_singlets(self, dst, src):
+        # apply mat for operators that do not accept lists
+        assert len(dst) == len(src)
+        for idx in range(len(dst)):
+            self.mat(dst[idx], src[idx])
+
     def __call__(self, first, second=None):
         assert self.mat is not None
 
@@ -252,14 +258,7 @@ class matrix_operator(factor):
                 for x in dst:
                     x[:] = 0
 
-        if self.accept_list:
-            mat = self.mat
-        else:
-
-            def mat(dst, src):
-                assert len(dst) == len(src)
-                for idx in range(len(dst)):
-                    self.mat(dst[idx], src[idx])
+        mat = self.mat if self.accept_list else self._mat_singlets
 
         if distribute:
             self.vector_space[1].otype.distribute(mat, dst, src, zero_lhs=self.accept_guess[0])
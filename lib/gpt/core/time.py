@@ -197,3 +197,7 @@ class timer:
                 s += (" " * len(s_time)) + f"  flop/s = {fmin:.2e}/{fmax:.2e}/{favg:.2e}\n"
 
         return s[:-1]
+
+
+# shared timer for hot code paths that do not record timings
+disabled_timer = timer("", False)
@@ -23,8 +23,9 @@ from gpt.params import params_convention
 
 #
 # rhs_n_block: How many vectors are acted on at the same time
+# basis_n_block: How many basis vectors are processed at the same time in the block maps
 #
-@params_convention(make_hermitian=False, save_links=True, rhs_n_block=4)
+@params_convention(make_hermitian=False, save_links=True, rhs_n_block=4, basis_n_block=8)
 def create_links(A, fmat, basis, params):
     # NOTE: we expect the blocks in the basis vectors
     # to already be orthogonalized!
@@ -32,6 +33,7 @@ def create_links(A, fmat, basis, params):
     make_hermitian = params["make_hermitian"]
     save_links = params["save_links"]
     rhs_n_block = params["rhs_n_block"]
+    basis_n_block = params["basis_n_block"]
     assert not (make_hermitian and not save_links)
 
     # sanity
@@ -97,8 +99,11 @@ def create_links(A, fmat, basis, params):
 
     # create block maps
     t("blockmap")
-    dirbms = [gpt.block.map(c_grid, basis, dirmasks[p]) for p, (mu, fb) in enumerate(dirdisps)]
-    fullbm = gpt.block.map(c_grid, basis)
+    dirbms = [
+        gpt.block.map(c_grid, basis, dirmasks[p], basis_n_block)
+        for p, (mu, fb) in enumerate(dirdisps)
+    ]
+    fullbm = gpt.block.map(c_grid, basis, basis_n_block=basis_n_block)
 
     for i0 in range(0, len(basis), rhs_n_block):
         # rhs indices
@@ -152,15 +157,21 @@ def create_links(A, fmat, basis, params):
 def communicate_links(A, dirdisps_forward, make_hermitian):
     assert isinstance(A, list)
     assert len(A) == 2 * len(dirdisps_forward) + 1
+
+    if not make_hermitian:
+        nbasis = A[0].otype.shape[0]
+        assert nbasis % 2 == 0
+        nb = nbasis // 2
+
     for p, (mu, fb) in enumerate(dirdisps_forward):
         p_other = p + 4
         shift_fb = fb * -1
-        Atmp = gpt.copy(A[p])
-        if not make_hermitian:
+        if make_hermitian:
+            # the links can be used directly if no prefactor needs to be applied
+            Atmp = A[p]
+        else:
+            Atmp = gpt.copy(A[p])
             # Atmp = prefactor_dagger(Atmp) * Atmp  # this would be more elegant
-            nbasis = A[0].otype.shape[0]
-            assert nbasis % 2 == 0
-            nb = nbasis // 2
             Atmp[:, :, :, :, 0:nb, nb:nbasis] *= -1.0  # upper right block
             Atmp[:, :, :, :, nb:nbasis, 0:nb] *= -1.0  # lower left block
         A[p_other] @= gpt.adj(gpt.cshift(Atmp, mu, shift_fb))
@@ -233,7 +244,15 @@ def nearest_neighbor_operator(fine_matrix, coarse_grid, basis, params, daggered=
 
     assert not daggered
 
-    create_links(A, fine_matrix, basis, make_hermitian=params["make_hermitian"], save_links=True)
+    create_links(
+        A,
+        fine_matrix,
+        basis,
+        make_hermitian=params["make_hermitian"],
+        save_links=True,
+        rhs_n_block=params["rhs_n_block"],
+        basis_n_block=params["basis_n_block"],
+    )
 
     level = 1 if isinstance(fine_matrix.otype, gpt.ot_matrix_complex_additive_group) else 0
     return gpt.qcd.fermion.coarse_fermion(A, level=level)
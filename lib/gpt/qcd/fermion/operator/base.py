@@ -230,7 +230,7 @@ class base(gpt.matrix_operator):
     def converted(self, dst_precision):
         return self.updated(gpt.convert(self.U, dst_precision))
 
-    @params_convention(make_hermitian=False)
+    @params_convention(make_hermitian=False, rhs_n_block=4, basis_n_block=8)
     def coarsened(self, coarse_grid, basis, params):
         # TODO: allow for non-nearest-neighbor operators as well
         return gpt.qcd.fermion.coarse.nearest_neighbor_operator(
@@ -67,12 +67,19 @@ def find_near_null_vectors(w, cgrid):
 mg_setup_2lvl = i.multi_grid_setup(block_size=[[2, 2, 2, 2]], projector=find_near_null_vectors)
 
 mg_setup_3lvl = i.multi_grid_setup(
-    block_size=[[2, 2, 2, 2], [2, 1, 1, 1]], projector=find_near_null_vectors
+    block_size=[[2, 2, 2, 2], [2, 1, 1, 1]],
+    projector=find_near_null_vectors,
+    setup_precision=g.single,
+)
+
+mg_setup_2lvl_sp_setup = i.multi_grid_setup(
+    block_size=[[2, 2, 2, 2]], projector=find_near_null_vectors, setup_precision=g.single
 )
 
 mg_setup_2lvl_dp = mg_setup_2lvl(w_dp)
 mg_setup_2lvl_sp = mg_setup_2lvl(w_sp)
 mg_setup_3lvl_sp = mg_setup_3lvl(w_sp)
+mg_setup_2lvl_dp_sp_setup = mg_setup_2lvl_sp_setup(w_dp)
 
 # mg inner solvers
 wrapper_solver = i.fgmres({"eps": 1e-1, "maxiter": 10, "restartlen": 5, "checkres": False})
@@ -89,6 +96,11 @@ mg_2lvl_vcycle_dp = i.sequence(
     i.calculate_residual("after smoother"),  # optional
 )
 
+mg_2lvl_vcycle_dp_sp_setup = i.sequence(
+    i.coarse_grid(coarsest_solver, *mg_setup_2lvl_dp_sp_setup[0]),
+    smooth_solver,
+)
+
 # For timing purposes, keep variables of solvers of various levels
 smooth_solver_lvl3 = smooth_solver.modified()
 smooth_solver_lvl2 = smooth_solver.modified()
@@ -147,6 +159,20 @@ g.message(
 assert eps2 < 1e-12
 assert niter_prec_2lvl_mg_vcycle_dp <= niter_prec_smooth
 
+# preconditioned inversion (2lvl mg -- vcycle -- double precision, single precision setup)
+fgmres_outer = i.fgmres(fgmres_params, prec=mg_2lvl_vcycle_dp_sp_setup)
+sol_prec_2lvl_mg_vcycle_dp_sp_setup = g.eval(fgmres_outer(w_dp) * src)
+
+eps2 = g.norm2(w_dp * sol_prec_2lvl_mg_vcycle_dp_sp_setup - src) / g.norm2(src)
+niter_prec_2lvl_mg_vcycle_dp_sp_setup = len(fgmres_outer.history)
+g.message(
+    "Test resid/iter fgmres + 2lvl vcycle mg double with single precision setup:",
+    eps2,
+    niter_prec_2lvl_mg_vcycle_dp_sp_setup,
+)
+assert eps2 < 1e-12
+assert niter_prec_2lvl_mg_vcycle_dp_sp_setup <= niter_prec_smooth
+
 # preconditioned inversion (3lvl mg -- kcycle -- mixed precision)
 fgmres_outer = i.fgmres(
     fgmres_params,